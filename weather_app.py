@@ -1,263 +1,645 @@
-import requests
-import json
-import sqlite3
-from datetime import datetime
-import os
-
-class WeatherDataLogger:
-    """Handles database operations for logging weather data"""
-    
-    def __init__(self, db_name="weather_data.db"):
-        self.db_name = db_name
-        self._init_database()
-    
-    def _init_database(self):
-        """Initialize SQLite database with required table"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        # Drop existing table to recreate with new structure
-        cursor.execute('DROP TABLE IF EXISTS weather_logs')
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS weather_logs (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                city_name TEXT NOT NULL,
-                temperature REAL NOT NULL,
-                humidity INTEGER NOT NULL,
-                pressure INTEGER NOT NULL,
-                wind_speed REAL NOT NULL,
-                weather_condition TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
-                api_response TEXT NOT NULL
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        print(" Database initialized with new structure!")
-    
-    def log_weather_data(self, city_name, temperature, humidity, pressure, wind_speed, weather_condition, api_response):
-        """Log weather data to database"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        timestamp = datetime.now().isoformat()
-        
-        cursor.execute('''
-            INSERT INTO weather_logs 
-            (city_name, temperature, humidity, pressure, wind_speed, weather_condition, timestamp, api_response)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        ''', (city_name, temperature, humidity, pressure, wind_speed, weather_condition, timestamp, json.dumps(api_response)))
-        
-        conn.commit()
-        conn.close()
-        print(f" Weather data for {city_name} logged successfully!")
-    
-    def get_logs(self, limit=10):
-        """Retrieve recent weather logs"""
-        conn = sqlite3.connect(self.db_name)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT * FROM weather_logs 
-            ORDER BY timestamp DESC 
-            LIMIT ?
-        ''', (limit,))
-        
-        logs = cursor.fetchall()
-        conn.close()
-        return logs
-
-class WeatherAPI:
-    """Handles API interactions with OpenWeatherMap"""
-    
-    def __init__(self, api_key):
-        self.api_key = api_key
-        self.base_url = "http://api.openweathermap.org/data/2.5/weather"
-    
-    def get_weather_data(self, city_name):
-        """Fetch weather data for a given city"""
-        params = {
-            'q': city_name,
-            'appid': self.api_key,
-            'units': 'metric'  # For Celsius temperature
-        }
-        
-        try:
-            response = requests.get(self.base_url, params=params, timeout=10)
-            response.raise_for_status()  # Raises an HTTPError for bad responses
-            
-            data = response.json()
-            
-            # Validate API response
-            if data.get('cod') != 200:
-                raise ValueError(f"API Error: {data.get('message', 'Unknown error')}")
-            
-            return data
-            
-        except requests.exceptions.RequestException as e:
-            raise ConnectionError(f"Failed to connect to weather API: {str(e)}")
-        except ValueError as e:
-            raise e
-        except Exception as e:
-            raise RuntimeError(f"Unexpected error: {str(e)}")
-
-class WeatherProcessor:
-    """Processes and extracts relevant weather information"""
-    
-    @staticmethod
-    def extract_weather_info(api_response):
-        """Extract relevant weather information from API response"""
-        try:
-            city_name = api_response['name']
-            temperature = api_response['main']['temp']
-            humidity = api_response['main']['humidity']
-            pressure = api_response['main']['pressure']
-            wind_speed = api_response.get('wind', {}).get('speed', 0)  # Handle missing wind data
-            weather_condition = api_response['weather'][0]['description']
-            
-            # Convert timestamp to readable format
-            timestamp = api_response.get('dt', None)
-            if timestamp:
-                local_time = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-            else:
-                local_time = "N/A"
-            
-            return {
-                'city_name': city_name,
-                'temperature': temperature,
-                'humidity': humidity,
-                'pressure': pressure,
-                'wind_speed': wind_speed,
-                'weather_condition': weather_condition,
-                'local_time': local_time,
-                'full_response': api_response
-            }
-        except KeyError as e:
-            raise ValueError(f"Invalid API response format: Missing key {str(e)}")
-
-class WeatherApplication:
-    """Main application class that orchestrates the weather app"""
-    
-    def __init__(self, api_key):
-        self.weather_api = WeatherAPI(api_key)
-        self.data_logger = WeatherDataLogger()
-        self.weather_processor = WeatherProcessor()
-    
-    def get_weather_for_city(self, city_name):
-        """Get weather data for a single city and log it"""
-        try:
-            # Validate input
-            if not city_name or not city_name.strip():
-                raise ValueError("City name cannot be empty")
-            
-            city_name = city_name.strip()
-            
-            print(f"\n  Fetching weather data for: {city_name}")
-            
-            # Get data from API
-            api_response = self.weather_api.get_weather_data(city_name)
-            
-            # Process the data
-            weather_info = self.weather_processor.extract_weather_info(api_response)
-            
-            # Display results
-            self._display_weather_info(weather_info)
-            
-            # Log to database
-            self.data_logger.log_weather_data(
-                weather_info['city_name'],
-                weather_info['temperature'],
-                weather_info['humidity'],
-                weather_info['pressure'],
-                weather_info['wind_speed'],
-                weather_info['weather_condition'],
-                weather_info['full_response']
-            )
-            
-            return weather_info
-            
-        except Exception as e:
-            print(f" Error: {str(e)}")
-            return None
-    
-    def _display_weather_info(self, weather_info):
-        """Display weather information in a user-friendly format"""
-        print("\n" + "="*50)
-        print(f" CITY: {weather_info['city_name']}")
-        print("="*50)
-        print(f" Local Time: {weather_info['local_time']}")
-        print(f"  Temperature: {weather_info['temperature']}°C")
-        print(f" Humidity: {weather_info['humidity']}%")
-        print(f" Pressure: {weather_info['pressure']} hPa")
-        print(f" Wind Speed: {weather_info['wind_speed']} m/s")
-        print(f" Condition: {weather_info['weather_condition'].title()}")
-        print("="*50)
-    
-    def show_recent_logs(self):
-        """Display recent weather logs"""
-        print("\n RECENT WEATHER LOGS")
-        print("="*80)
-        
-        logs = self.data_logger.get_logs(limit=5)
-        
-        if not logs:
-            print("No logs found.")
-            return
-        
-        for log in logs:
-            # Safely unpack with proper error handling
-            if len(log) == 9:  # New format with pressure and wind_speed
-                log_id, city, temp, humidity, pressure, wind_speed, condition, timestamp, _ = log
-                timestamp = datetime.fromisoformat(timestamp).strftime("%Y-%m-%d %H:%M:%S")
-                print(f"{log_id}. {city} | {temp}°C | {humidity}% | {pressure}hPa | {wind_speed}m/s | {condition} | {timestamp}")
-            else:
-                # Handle old format logs gracefully
-                print(f"Log format: {len(log)} columns - Data: {log}")
-
-def main():
-    """Main function to run the weather application"""
-    
-    # API Key - You need to get this from OpenWeatherMap
-    API_KEY = "dd10d23bf3e0104bd4e939edbcb06ea9"  # Replace with your actual API key
-    
-    # Check if API key is set
-    if not API_KEY or API_KEY == "YOUR_API_KEY_HERE":
-        print(" Please get a free API key from OpenWeatherMap and replace the API_KEY variable")
-        print(" Visit: https://openweathermap.org/api")
-        return
-    
-    # Initialize application
-    app = WeatherApplication(API_KEY)
-    
-    print(" WELCOME TO REAL-TIME WEATHER INFORMATION & DATA LOGGER ")
-    print("="*60)
-    
-    while True:
-        print("\nOptions:")
-        print("1. Get weather for a city")
-        print("2. View recent logs")
-        print("3. Exit")
-        
-        choice = input("\nEnter your choice (1-3): ").strip()
-        
-        if choice == '1':
-            city_name = input("Enter city name: ").strip()
-            if city_name:
-                app.get_weather_for_city(city_name)
-            else:
-                print(" Please enter a valid city name.")
-        
-        elif choice == '2':
-            app.show_recent_logs()
-        
-        elif choice == '3':
-            print("👋 Thank you for using the Weather App! Goodbye!")
-            break
-        
-        else:
-            print(" Invalid choice. Please enter 1, 2, or 3.")
-
-if __name__ == "__main__":
+import requests
+from requests.adapters import HTTPAdapter, Retry
+import argparse
+import asyncio
+from dataclasses import dataclass
+import functools
+import json
+import sqlite3
+from datetime import datetime
+import os
+import sys
+import threading
+import time
+
+# httpx lets multi-city fetches run concurrently over a shared pool;
+# fall back to sequential requests if it isn't installed
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# cachetools provides the bounded TTL cache for repeated city lookups;
+# fall back to a minimal stand-in if it isn't installed
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+# orjson serializes ~3-10x faster than stdlib json, returns bytes
+# directly and parses bytes without a str decode; fall back to stdlib if
+# it isn't installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = lambda obj: json.dumps(obj).encode()
+    _loads = json.loads
+
+@functools.lru_cache(maxsize=1024)
+def _format_timestamp(epoch):
+    """Format an epoch timestamp for display; repeated values hit the cache"""
+    return datetime.fromtimestamp(epoch).strftime("%Y-%m-%d %H:%M:%S")
+
+class _SimpleTTLCache:
+    """Minimal TTLCache stand-in used when cachetools isn't installed"""
+
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = {}
+
+    def get(self, key, default=None):
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self._data and len(self._data) >= self.maxsize:
+            # Evict the oldest insertion; dicts preserve insertion order
+            del self._data[next(iter(self._data))]
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+class _ConnectionPool:
+    """One shared write connection plus per-thread read connections
+
+    WAL mode lets readers run concurrently with the writer, so reads
+    (e.g. showing recent logs) never block behind an in-flight insert.
+    """
+
+    def __init__(self, db_name):
+        self.db_name = db_name
+        # Single long-lived writer in WAL mode: avoids the open/close and
+        # journal-setup cost of reconnecting on every operation
+        self.write_conn = sqlite3.connect(db_name, isolation_level=None,
+                                          check_same_thread=False, cached_statements=256)
+        self.write_conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-20000;
+        ''')
+        self._read_local = threading.local()
+
+    def read_conn(self):
+        """Return this thread's read-only connection, creating it lazily"""
+        conn = getattr(self._read_local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_name, cached_statements=256)
+            conn.execute('PRAGMA query_only=1')
+            self._read_local.conn = conn
+        return conn
+
+    def close(self):
+        self.write_conn.close()
+        conn = getattr(self._read_local, 'conn', None)
+        if conn is not None:
+            conn.close()
+
+class WeatherDataLogger:
+    """Handles database operations for logging weather data"""
+
+    # Bumped whenever the schema changes; PRAGMA user_version tracks what
+    # an existing database file was created with
+    _SCHEMA_VERSION = 1
+
+    # Shared literals so SQLite's statement cache reuses the compiled
+    # VDBE program instead of re-parsing the SQL on every call
+    _INSERT_SQL = '''
+        INSERT INTO weather_logs
+        (city_name, temperature, humidity, pressure, wind_speed, weather_condition, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    '''
+    _INSERT_RAW_SQL = 'INSERT INTO weather_logs_raw (id, payload) VALUES (?, ?)'
+    _SELECT_SQL = '''
+        SELECT id, city_name, temperature, humidity, pressure,
+               wind_speed, weather_condition, timestamp
+        FROM weather_logs
+        ORDER BY timestamp DESC
+        LIMIT ?
+    '''
+
+    def __init__(self, db_name="weather_data.db", store_raw=False):
+        self.db_name = db_name
+        self.store_raw = store_raw
+        self._pool = _ConnectionPool(db_name)
+        self._conn = self._pool.write_conn
+        self._init_database()
+        # Pre-bind the write cursor's methods so the hot insert path skips
+        # the attribute lookups and bound-method creation per call
+        self._cursor = self._conn.cursor()
+        self._do_execute = self._cursor.execute
+        self._do_executemany = self._cursor.executemany
+
+    def _init_database(self):
+        """Initialize SQLite database with required table"""
+        cursor = self._conn.cursor()
+
+        version = cursor.execute('PRAGMA user_version').fetchone()[0]
+
+        legacy = False
+        if version < self._SCHEMA_VERSION:
+            # Pre-versioned databases stored ISO text timestamps and the
+            # raw payload inline; rebuild once, keeping the logged rows
+            columns = [row[1] for row in cursor.execute('PRAGMA table_info(weather_logs)')]
+            legacy = 'api_response' in columns
+
+        # SQLite DDL is transactional: one BEGIN ... COMMIT makes the whole
+        # rebuild atomic, so a crash mid-migration rolls back to the old
+        # schema and the migration retries on the next start
+        cursor.execute('BEGIN')
+        try:
+            if legacy:
+                cursor.execute('ALTER TABLE weather_logs RENAME TO weather_logs_legacy')
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS weather_logs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    city_name TEXT NOT NULL,
+                    temperature REAL NOT NULL,
+                    humidity INTEGER NOT NULL,
+                    pressure INTEGER NOT NULL,
+                    wind_speed REAL NOT NULL,
+                    weather_condition TEXT NOT NULL,
+                    timestamp INTEGER NOT NULL
+                )
+            ''')
+
+            # Raw API payloads live in a side table so the hot row store stays
+            # narrow; only populated when store_raw is enabled
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS weather_logs_raw (
+                    id INTEGER PRIMARY KEY,
+                    payload BLOB
+                )
+            ''')
+
+            if legacy:
+                # The 'utc' modifier treats the ISO strings as local time,
+                # which is what datetime.now().isoformat() wrote
+                cursor.execute('''
+                    INSERT INTO weather_logs
+                    (id, city_name, temperature, humidity, pressure, wind_speed, weather_condition, timestamp)
+                    SELECT id, city_name, temperature, humidity, pressure, wind_speed, weather_condition,
+                           CAST(strftime('%s', timestamp, 'utc') AS INTEGER)
+                    FROM weather_logs_legacy
+                ''')
+                cursor.execute('''
+                    INSERT INTO weather_logs_raw (id, payload)
+                    SELECT id, api_response FROM weather_logs_legacy
+                ''')
+                cursor.execute('DROP TABLE weather_logs_legacy')
+
+            # Keeps get_logs an index range scan instead of a full scan + sort
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS ix_weather_logs_ts
+                ON weather_logs(timestamp DESC)
+            ''')
+
+            if version < self._SCHEMA_VERSION:
+                cursor.execute(f'PRAGMA user_version = {self._SCHEMA_VERSION}')
+
+            cursor.execute('COMMIT')
+        except Exception:
+            cursor.execute('ROLLBACK')
+            raise
+
+        print(" Database initialized!")
+
+    def log_weather_data(self, api_response, raw_bytes=None):
+        """Log a raw API response to the database
+
+        Binds the response fields straight into the INSERT tuple, with no
+        intermediate dict between fetch and insert.
+        """
+        self.log_weather_data_many([self.row_from_response(api_response, raw_bytes)])
+
+        print(f" Weather data for {api_response['name']} logged successfully!")
+
+    @staticmethod
+    def row_from_response(api_response, raw_bytes=None):
+        """Build an insert row directly from a raw API response dict
+
+        When the caller still has the original response bytes they are
+        stored as-is, skipping a round of re-serialization.
+        """
+        main = api_response['main']
+        return (
+            api_response['name'],
+            main['temp'],
+            main['humidity'],
+            main['pressure'],
+            api_response.get('wind', {}).get('speed', 0),
+            api_response['weather'][0]['description'],
+            int(time.time()),
+            raw_bytes if raw_bytes is not None else _dumps(api_response)
+        )
+
+    def log_weather_data_many(self, rows):
+        """Log a batch of weather rows in a single transaction
+
+        Each row is the seven scalar columns followed by the serialized raw
+        payload; the payload is only stored when store_raw is enabled. One
+        BEGIN ... COMMIT (one fsync) for the whole batch instead of an
+        implicit transaction per row.
+        """
+        self._do_execute('BEGIN')
+        try:
+            if self.store_raw:
+                for row in rows:
+                    self._do_execute(self._INSERT_SQL, row[:7])
+                    self._do_execute(self._INSERT_RAW_SQL, (self._cursor.lastrowid, row[7]))
+            else:
+                self._do_executemany(self._INSERT_SQL, [row[:7] for row in rows])
+            self._do_execute('COMMIT')
+        except Exception:
+            self._do_execute('ROLLBACK')
+            raise
+
+    def get_raw_response(self, log_id):
+        """Fetch the stored raw API payload for a log entry, if any"""
+        cursor = self._pool.read_conn().execute(
+            'SELECT payload FROM weather_logs_raw WHERE id = ?', (log_id,)
+        )
+        row = cursor.fetchone()
+        return row[0] if row else None
+
+    def get_logs(self, limit=10):
+        """Retrieve recent weather logs"""
+        cursor = self._pool.read_conn().execute(self._SELECT_SQL, (limit,))
+
+        return cursor.fetchall()
+
+    def close(self):
+        """Close the database connections"""
+        self._pool.close()
+
+class WeatherAPI:
+    """Handles API interactions with OpenWeatherMap"""
+    
+    def __init__(self, api_key):
+        self.api_key = api_key
+        self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        # Session reuses the underlying connection pool, so only the first
+        # request pays the TCP/TLS handshake cost
+        self._session = requests.Session()
+        self._session.headers.update({'Accept-Encoding': 'gzip, deflate'})
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=10,
+            max_retries=Retry(total=2, backoff_factor=0.2)
+        )
+        self._session.mount('http://', adapter)
+        self._session.mount('https://', adapter)
+        # Repeat lookups for the same city within the TTL are served from
+        # memory instead of a fresh network round trip
+        cache_cls = TTLCache if TTLCache is not None else _SimpleTTLCache
+        self._cache = cache_cls(maxsize=128, ttl=300)
+        # Warm up DNS + TCP/TLS in the background so the first user query
+        # doesn't pay the handshake latency
+        threading.Thread(target=self._prewarm, daemon=True).start()
+
+    def _prewarm(self):
+        """Fire-and-forget request that seeds the connection pool"""
+        try:
+            self._session.head(self.base_url, timeout=5)
+        except Exception:
+            pass  # best effort; the first real request just pays the cost
+
+    def get_weather_data(self, city_name):
+        """Fetch weather data for a given city
+
+        Returns (parsed dict, raw response bytes) so callers that store the
+        payload don't have to re-serialize it.
+        """
+        cache_key = city_name.lower().strip()
+        hit = self._cache.get(cache_key)
+        if hit is not None:
+            return hit
+
+        params = {
+            'q': city_name,
+            'appid': self.api_key,
+            'units': 'metric'  # For Celsius temperature
+        }
+
+        try:
+            response = self._session.get(self.base_url, params=params, timeout=10)
+            response.raise_for_status()  # Raises an HTTPError for bad responses
+
+            # Parse the raw bytes directly; skips the bytes -> str decode
+            # that response.json() would do first
+            try:
+                data = _loads(response.content)
+            except ValueError as e:
+                raise ValueError(f"Invalid JSON in API response: {str(e)}")
+
+            # Validate API response
+            if data.get('cod') != 200:
+                raise ValueError(f"API Error: {data.get('message', 'Unknown error')}")
+
+            result = (data, response.content)
+            self._cache[cache_key] = result
+            return result
+
+        except requests.exceptions.RequestException as e:
+            raise ConnectionError(f"Failed to connect to weather API: {str(e)}")
+        except ValueError as e:
+            raise e
+        except Exception as e:
+            raise RuntimeError(f"Unexpected error: {str(e)}")
+
+    async def _get_one(self, client, city_name):
+        """Fetch one city on the shared async client"""
+        cache_key = city_name.lower().strip()
+        hit = self._cache.get(cache_key)
+        if hit is not None:
+            return hit
+
+        params = {
+            'q': city_name,
+            'appid': self.api_key,
+            'units': 'metric'
+        }
+
+        response = await client.get(self.base_url, params=params)
+        response.raise_for_status()
+
+        data = _loads(response.content)
+
+        if data.get('cod') != 200:
+            raise ValueError(f"API Error: {data.get('message', 'Unknown error')}")
+
+        result = (data, response.content)
+        self._cache[cache_key] = result
+        return result
+
+    async def _get_many_async(self, city_names):
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        async with httpx.AsyncClient(limits=limits, timeout=10.0) as client:
+            return await asyncio.gather(
+                *[self._get_one(client, city) for city in city_names],
+                return_exceptions=True
+            )
+
+    def get_many(self, city_names):
+        """Fetch weather for several cities concurrently
+
+        Returns a list aligned with city_names of (parsed dict, raw bytes)
+        pairs; failed lookups are returned as the exception instead.
+        """
+        if httpx is None:
+            # Sequential fallback over the keep-alive session
+            results = []
+            for city in city_names:
+                try:
+                    results.append(self.get_weather_data(city))
+                except Exception as e:
+                    results.append(e)
+            return results
+
+        return asyncio.run(self._get_many_async(city_names))
+
+    def close(self):
+        """Close the HTTP session and its connection pool"""
+        self._session.close()
+
+@dataclass(slots=True)
+class WeatherInfo:
+    """Extracted weather fields; slots keep per-request allocation cheap"""
+    city_name: str
+    temperature: float
+    humidity: int
+    pressure: int
+    wind_speed: float
+    weather_condition: str
+    local_time: str
+    full_response: dict
+
+class WeatherProcessor:
+    """Processes and extracts relevant weather information"""
+
+    @staticmethod
+    def extract_weather_info(api_response):
+        """Extract relevant weather information from API response"""
+        try:
+            city_name = api_response['name']
+            temperature = api_response['main']['temp']
+            humidity = api_response['main']['humidity']
+            pressure = api_response['main']['pressure']
+            wind_speed = api_response.get('wind', {}).get('speed', 0)  # Handle missing wind data
+            weather_condition = api_response['weather'][0]['description']
+            
+            # Convert timestamp to readable format
+            timestamp = api_response.get('dt', None)
+            if timestamp:
+                local_time = datetime.fromtimestamp(timestamp).strftime("%Y-%m-%d %H:%M:%S")
+            else:
+                local_time = "N/A"
+            
+            return WeatherInfo(
+                city_name=city_name,
+                temperature=temperature,
+                humidity=humidity,
+                pressure=pressure,
+                wind_speed=wind_speed,
+                weather_condition=weather_condition,
+                local_time=local_time,
+                full_response=api_response
+            )
+        except KeyError as e:
+            raise ValueError(f"Invalid API response format: Missing key {str(e)}")
+
+class WeatherApplication:
+    """Main application class that orchestrates the weather app"""
+    
+    def __init__(self, api_key):
+        self.weather_api = WeatherAPI(api_key)
+        self.data_logger = WeatherDataLogger()
+        self.weather_processor = WeatherProcessor()
+    
+    def get_weather_for_city(self, city_name):
+        """Get weather data for a single city and log it"""
+        try:
+            # Validate input
+            if not city_name or not city_name.strip():
+                raise ValueError("City name cannot be empty")
+            
+            city_name = city_name.strip()
+            
+            print(f"\n  Fetching weather data for: {city_name}")
+            
+            # Get data from API
+            api_response, raw_bytes = self.weather_api.get_weather_data(city_name)
+
+            # Process the data
+            weather_info = self.weather_processor.extract_weather_info(api_response)
+
+            # Display results
+            self._display_weather_info(weather_info)
+
+            # Log to database, storing the original response bytes
+            self.data_logger.log_weather_data(api_response, raw_bytes)
+
+            return weather_info
+
+        except Exception as e:
+            print(f" Error: {str(e)}")
+            return None
+
+    def get_weather_for_cities(self, city_names):
+        """Get weather for several cities concurrently and log them in one batch"""
+        city_names = [city.strip() for city in city_names if city and city.strip()]
+
+        if not city_names:
+            print(" Error: No valid city names given")
+            return []
+
+        print(f"\n  Fetching weather data for: {', '.join(city_names)}")
+
+        responses = self.weather_api.get_many(city_names)
+
+        rows = []
+        results = []
+
+        for city_name, result in zip(city_names, responses):
+            try:
+                if isinstance(result, Exception):
+                    raise result
+
+                api_response, raw_bytes = result
+                weather_info = self.weather_processor.extract_weather_info(api_response)
+
+                self._display_weather_info(weather_info)
+
+                rows.append(self.data_logger.row_from_response(api_response, raw_bytes))
+                results.append(weather_info)
+
+            except Exception as e:
+                print(f" Error: {str(e)}")
+                results.append(None)
+
+        # Flush all buffered rows in a single transaction
+        if rows:
+            self.data_logger.log_weather_data_many(rows)
+            print(f" Logged weather data for {len(rows)} cities!")
+
+        return results
+
+    def _display_weather_info(self, weather_info):
+        """Display weather information in a user-friendly format"""
+        # One buffered write instead of a syscall per line
+        sys.stdout.write("\n".join([
+            "",
+            "="*50,
+            f" CITY: {weather_info.city_name}",
+            "="*50,
+            f" Local Time: {weather_info.local_time}",
+            f"  Temperature: {weather_info.temperature}°C",
+            f" Humidity: {weather_info.humidity}%",
+            f" Pressure: {weather_info.pressure} hPa",
+            f" Wind Speed: {weather_info.wind_speed} m/s",
+            f" Condition: {weather_info.weather_condition.title()}",
+            "="*50
+        ]) + "\n")
+    
+    def show_recent_logs(self):
+        """Display recent weather logs"""
+        lines = ["\n RECENT WEATHER LOGS", "="*80]
+
+        logs = self.data_logger.get_logs(limit=5)
+
+        if not logs:
+            lines.append("No logs found.")
+        else:
+            lines.extend(
+                f"{log_id}. {city} | {temp}°C | {humidity}% | {pressure}hPa"
+                f" | {wind_speed}m/s | {condition} | {_format_timestamp(timestamp)}"
+                for log_id, city, temp, humidity, pressure, wind_speed, condition, timestamp in logs
+            )
+
+        # One buffered write instead of a syscall per row
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def main():
+    """Main function to run the weather application"""
+
+    parser = argparse.ArgumentParser(
+        description="Real-time weather information and data logger"
+    )
+    parser.add_argument('--cities',
+                        help="comma-separated city names to fetch in one concurrent batch")
+    parser.add_argument('--file',
+                        help="file with one city name per line to fetch in one concurrent batch")
+    args = parser.parse_args()
+
+    # API Key - You need to get this from OpenWeatherMap
+    API_KEY = "dd10d23bf3e0104bd4e939edbcb06ea9"  # Replace with your actual API key
+
+    # Check if API key is set
+    if not API_KEY or API_KEY == "YOUR_API_KEY_HERE":
+        print(" Please get a free API key from OpenWeatherMap and replace the API_KEY variable")
+        print(" Visit: https://openweathermap.org/api")
+        return
+
+    # Initialize application
+    app = WeatherApplication(API_KEY)
+
+    # Non-interactive mode: fetch all cities concurrently, log them in a
+    # single transaction and exit
+    if args.cities or args.file:
+        cities = []
+        if args.cities:
+            cities.extend(args.cities.split(','))
+        if args.file:
+            try:
+                with open(args.file) as f:
+                    cities.extend(f.read().splitlines())
+            except OSError as e:
+                print(f" Error: Could not read city file: {str(e)}")
+                sys.exit(1)
+
+        app.get_weather_for_cities(cities)
+
+        app.weather_api.close()
+        app.data_logger.close()
+        return
+
+    print(" WELCOME TO REAL-TIME WEATHER INFORMATION & DATA LOGGER ")
+    print("="*60)
+    
+    while True:
+        print("\nOptions:")
+        print("1. Get weather for a city")
+        print("2. View recent logs")
+        print("3. Exit")
+        
+        choice = input("\nEnter your choice (1-3): ").strip()
+        
+        if choice == '1':
+            city_name = input("Enter city name: ").strip()
+            if city_name:
+                app.get_weather_for_city(city_name)
+            else:
+                print(" Please enter a valid city name.")
+        
+        elif choice == '2':
+            app.show_recent_logs()
+        
+        elif choice == '3':
+            print("👋 Thank you for using the Weather App! Goodbye!")
+            app.weather_api.close()
+            app.data_logger.close()
+            break
+        
+        else:
+            print(" Invalid choice. Please enter 1, 2, or 3.")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file